@@ -1,35 +1,71 @@
 #!/usr/bin/env python3
 # Based on https://python101.readthedocs.io/pl/latest/pygame/pong/#
+import functools
+import operator
 import pygame
 from typing import Type
 import skfuzzy as fuzz
 import skfuzzy.control as fuzzcontrol
 
 FPS = 30
+AI_UPS = 15
 
 
 class Board:
     def __init__(self, width: int, height: int):
         self.surface = pygame.display.set_mode((width, height), 0, 32)
         pygame.display.set_caption("AIFundamentals - PongGame")
+        self._bg = (0, 0, 0)
+        self._prev_rects = []
+        self._prev_drawables = ()
 
     def draw(self, *args):
-        background = (0, 0, 0)
-        self.surface.fill(background)
-        for drawable in args:
-            drawable.draw_on(self.surface)
-
-        pygame.display.update()
+        rects = [drawable.rect.copy() for drawable in args]
+        if len(args) != len(self._prev_drawables) or any(
+            drawable is not prev for drawable, prev in zip(args, self._prev_drawables)
+        ):
+            # first frame (or a different set of drawables): full redraw
+            self.surface.fill(self._bg)
+            dirty = None
+        else:
+            # only the areas covered by each drawable now or in the last frame
+            dirty = [rect.union(prev) for rect, prev in zip(rects, self._prev_rects)]
+            for rect in dirty:
+                self.surface.fill(self._bg, rect)
+        self.surface.blits([(drawable.surface, drawable.rect) for drawable in args], False)
+        self._prev_rects = rects
+        self._prev_drawables = args
+
+        if dirty is None:
+            # display.update(None) updates nothing, only update() presents all
+            pygame.display.update()
+        else:
+            pygame.display.update(dirty)
+
+    def invalidate(self):
+        # window content lost (exposed/restored): next draw is a full redraw
+        self._prev_drawables = ()
 
 
 class Drawable:
-    def __init__(self, x: int, y: int, width: int, height: int, color=(255, 255, 255)):
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        color=(255, 255, 255),
+        alpha: bool = True,
+    ):
         self.width = width
         self.height = height
         self.color = color
-        self.surface = pygame.Surface(
-            [width, height], pygame.SRCALPHA, 32
-        ).convert_alpha()
+        if alpha:
+            self.surface = pygame.Surface(
+                [width, height], pygame.SRCALPHA, 32
+            ).convert_alpha()
+        else:
+            self.surface = pygame.Surface([width, height]).convert()
         self.rect = self.surface.get_rect(x=x, y=y)
 
     def draw_on(self, surface):
@@ -46,7 +82,13 @@ class Ball(Drawable):
         speed: int = 3,
     ):
         super(Ball, self).__init__(x, y, radius, radius, color)
-        pygame.draw.ellipse(self.surface, self.color, [0, 0, self.width, self.height])
+        # every color bounce_y_power can reach, rendered once
+        self._variants = [
+            (c, self._render(c))
+            for c in ((color[0], g, color[2]) for g in range(color[1], 256, 10))
+        ]
+        self._variant_idx = 0
+        self.surface = self._variants[0][1]
         self.x_speed = speed
         self.y_speed = speed
         self.start_speed = speed
@@ -54,6 +96,20 @@ class Ball(Drawable):
         self.start_y = y
         self.start_color = color
         self.last_collision = 0
+        # sub-pixel position, rect keeps the truncated value
+        self._fx = float(self.rect.x)
+        self._fy = float(self.rect.y)
+
+    def _render(self, color):
+        surface = pygame.Surface(
+            [self.width, self.height], pygame.SRCALPHA, 32
+        ).convert_alpha()
+        pygame.draw.ellipse(surface, color, [0, 0, self.width, self.height])
+        return surface
+
+    def bind_board(self, board: Board):
+        self._max_x = board.surface.get_width() - self.rect.width
+        self._max_y = board.surface.get_height() - self.rect.height
 
     def bounce_y(self):
         self.y_speed *= -1
@@ -62,12 +118,8 @@ class Ball(Drawable):
         self.x_speed *= -1
 
     def bounce_y_power(self):
-        self.color = (
-            self.color[0],
-            self.color[1] + 10 if self.color[1] < 255 else self.color[1],
-            self.color[2],
-        )
-        pygame.draw.ellipse(self.surface, self.color, [0, 0, self.width, self.height])
+        self._variant_idx = min(self._variant_idx + 1, len(self._variants) - 1)
+        self.color, self.surface = self._variants[self._variant_idx]
         self.x_speed *= 1.1
         self.y_speed *= 1.1
         self.bounce_y()
@@ -75,34 +127,45 @@ class Ball(Drawable):
     def reset(self):
         self.rect.x = self.start_x
         self.rect.y = self.start_y
+        self._fx = float(self.rect.x)
+        self._fy = float(self.rect.y)
         self.x_speed = self.start_speed
         self.y_speed = self.start_speed
-        self.color = self.start_color
+        self._variant_idx = 0
+        self.color, self.surface = self._variants[0]
         self.bounce_y()
 
-    def move(self, board: Board, *args):
-        self.rect.x += round(self.x_speed)
-        self.rect.y += round(self.y_speed)
+    def move(self, board: Board, now: int, *args):
+        rect = self.rect
+        fx = self._fx + self.x_speed
+        fy = self._fy + self.y_speed
+        self._fx = fx
+        self._fy = fy
+        rect.x = int(fx)
+        rect.y = int(fy)
 
-        if self.rect.x < 0 or self.rect.x > (
-            board.surface.get_width() - self.rect.width
-        ):
-            self.bounce_x()
+        bounce = (fx < 0) | (fx > self._max_x)
+        self.x_speed *= 1 - 2 * bounce
 
-        if self.rect.y < 0 or self.rect.y > (
-            board.surface.get_height() - self.rect.height
-        ):
+        out = (fy < 0) | (fy > self._max_y)
+        if out:
             self.reset()
 
-        timestamp = pygame.time.get_ticks()
-        if timestamp - self.last_collision < FPS * 4:
+        if now - self.last_collision < FPS * 4:
             return
 
+        ball_top = rect.y
+        ball_bottom = ball_top + rect.height
         for racket in args:
-            if self.rect.colliderect(racket.rect):
-                self.last_collision = pygame.time.get_ticks()
-                if (self.rect.right < racket.rect.left + racket.rect.width // 4) or (
-                    self.rect.left > racket.rect.right - racket.rect.width // 4
+            racket_rect = racket.rect
+            racket_top = racket_rect.y
+            if ball_bottom < racket_top or ball_top > racket_top + racket_rect.height:
+                continue
+            if rect.colliderect(racket_rect):
+                self.last_collision = now
+                quarter = racket_rect.width // 4
+                if (rect.right < racket_rect.left + quarter) or (
+                    rect.left > racket_rect.right - quarter
                 ):
                     self.bounce_y_power()
                 else:
@@ -119,21 +182,25 @@ class Racket(Drawable):
         color=(255, 255, 255),
         max_speed: int = 10,
     ):
-        super(Racket, self).__init__(x, y, width, height, color)
+        super(Racket, self).__init__(x, y, width, height, color, alpha=False)
         self.max_speed = max_speed
         self.surface.fill(color)
 
+    def bind_bounds(self, board_w: int):
+        self._max_x = board_w - self.width
+
     def move(self, x: int, board: Board):
         delta = x - self.rect.x
-        delta = self.max_speed if delta > self.max_speed else delta
-        delta = -self.max_speed if delta < -self.max_speed else delta
-        delta = 0 if (self.rect.x + delta) < 0 else delta
-        delta = (
-            0
-            if (self.rect.x + self.width + delta) > board.surface.get_width()
-            else delta
-        )
-        self.rect.x += delta
+        if delta > self.max_speed:
+            delta = self.max_speed
+        elif delta < -self.max_speed:
+            delta = -self.max_speed
+        new_x = self.rect.x + delta
+        if new_x < 0:
+            new_x = 0
+        elif new_x > self._max_x:
+            new_x = self._max_x
+        self.rect.x = new_x
 
 
 class Player:
@@ -157,38 +224,65 @@ class Player:
         """
         pass
 
+    def hold(self):
+        """
+        Repeat the last decision on frames without an AI update,
+        defined in derived classes
+        """
+        pass
+
 
 class PongGame:
     def __init__(
         self, width: int, height: int, player1: Type[Player], player2: Type[Player]
     ):
         pygame.init()
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(
+            [pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE]
+        )
         self.board = Board(width, height)
+        self._width = width
         self.fps_clock = pygame.time.Clock()
         self.ball = Ball(width // 2, height // 2)
+        self.ball.bind_board(self.board)
 
         self.opponent_paddle = Racket(x=width // 2, y=0)
+        self.opponent_paddle.bind_bounds(width)
         self.oponent = player1(self.opponent_paddle, self.ball, self.board)
 
         self.player_paddle = Racket(x=width // 2, y=height - 20)
+        self.player_paddle.bind_bounds(width)
         self.player = player2(self.player_paddle, self.ball, self.board)
 
     def run(self):
+        ball_rect = self.ball.rect
+        oponent_rect = self.oponent.racket.rect
+        player_rect = self.player.racket.rect
+        ai_every = max(1, FPS // AI_UPS)
+        frame = 0
         while not self.handle_events():
-            self.ball.move(self.board, self.player_paddle, self.opponent_paddle)
+            now = pygame.time.get_ticks()
+            self.ball.move(self.board, now, self.player_paddle, self.opponent_paddle)
             self.board.draw(
                 self.ball,
                 self.player_paddle,
                 self.opponent_paddle,
             )
-            self.oponent.act(
-                self.oponent.racket.rect.centerx - self.ball.rect.centerx,
-                self.oponent.racket.rect.centery - self.ball.rect.centery,
-            )
-            self.player.act(
-                self.player.racket.rect.centerx - self.ball.rect.centerx,
-                self.player.racket.rect.centery - self.ball.rect.centery,
-            )
+            if frame % ai_every == 0:
+                ball_x, ball_y = ball_rect.center
+                self.oponent.act(
+                    oponent_rect.centerx - ball_x,
+                    oponent_rect.centery - ball_y,
+                )
+                self.player.act(
+                    player_rect.centerx - ball_x,
+                    player_rect.centery - ball_y,
+                )
+            else:
+                self.oponent.hold()
+                self.player.hold()
+            frame += 1
             self.fps_clock.tick(FPS)
 
     def handle_events(self):
@@ -198,22 +292,29 @@ class PongGame:
             ):
                 pygame.quit()
                 return True
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                self.board.invalidate()
         keys = pygame.key.get_pressed()
         if keys[pygame.constants.K_LEFT]:
             self.player.move_manual(0)
         elif keys[pygame.constants.K_RIGHT]:
-            self.player.move_manual(self.board.surface.get_width())
+            self.player.move_manual(self._width)
         return False
 
 
 class NaiveOponent(Player):
     def __init__(self, racket: Racket, ball: Ball, board: Board):
         super(NaiveOponent, self).__init__(racket, ball, board)
+        self._target = racket.rect.x
 
     def act(self, x_diff: int, y_diff: int):
         x_cent = self.ball.rect.centerx
+        self._target = x_cent
         self.move(x_cent)
 
+    def hold(self):
+        self.move(self._target)
+
 
 class HumanPlayer(Player):
     def __init__(self, racket: Racket, ball: Ball, board: Board):
@@ -227,75 +328,295 @@ class HumanPlayer(Player):
 # DO NOT MODIFY CODE ABOVE THIS LINE
 # ----------------------------------
 
-#import numpy as np
+import numpy as np
 #import matplotlib.pyplot as plt
+#wymaga numba (patrz README): pierwszy FuzzyPlayer kompiluje jądro (3.5-5 s),
+#wynik trafia do __pycache__ (cache=True), kolejne uruchomienia ~0.25 s
+from numba import njit
+
+
+#wierzchołki trójkątów (a, b, c), z tych samych buduje się zmienne skfuzzy
+#dla x (800)
+#-edge    -middle_edge     -middle_edge/2      center(0)        middle_edge/2       middle_edge      edge
+X_TRI = (
+    (-400.0, -400.0, -20.0),  # far_left
+    (-30.0, -15.0, 0.0),  # left
+    (-15.0, 0.0, 15.0),  # center
+    (0.0, 15.0, 30.0),  # right
+    (20.0, 400.0, 400.0),  # far_right
+)
+#dla y (400)
+Y_TRI = (
+    (-200.0, -100.0, 0.0),  # above
+    (-100.0, 0.0, 100.0),  # center
+    (0.0, 100.0, 200.0),  # below
+)
+#prędkość
+V_TRI = (
+    (-10.0, -10.0, -10.0),  # fast_left
+    (-9.0, -9.0, -3.0),  # slow_left
+    (-3.0, 0.0, 3.0),  # stop
+    (3.0, 9.0, 9.0),  # slow_right
+    (10.0, 10.0, 10.0),  # fast_right
+)
+X_TERMS = ('far_left', 'left', 'center', 'right', 'far_right')
+Y_TERMS = ('above', 'center', 'below')
+V_TERMS = ('fast_left', 'slow_left', 'stop', 'slow_right', 'fast_right')
+#(term x, maska termów y połączonych przez OR (0 = bez warunku), term velocity)
+#z tej tabeli budowane są też reguły skfuzzy w FuzzyPlayer
+RULES = (
+    (1, 0b011, 4),
+    (3, 0b011, 0),
+    (0, 0, 4),
+    (1, 0, 3),
+    (2, 0, 2),
+    (3, 0, 1),
+    (4, 0, 0),
+)
+
+
+def _edges(triangles, universe):
+    """
+    Triangles as skfuzzy sees them once sampled on `universe`, e.g. the
+    [-10, -10, -10] spike on range(-10, 11) becomes [-10, -10, -9].
+
+    A vertical edge (a == b or b == c) gets its foot moved one step outside
+    the universe, so no span is ever zero.
+    """
+    step = universe[1] - universe[0]
+    edges = []
+    for tri in triangles:
+        mf = fuzz.trimf(universe, tri)
+        support = np.nonzero(mf)[0]
+        a = universe[max(support[0] - 1, 0)]
+        b = universe[np.argmax(mf)]
+        c = universe[min(support[-1] + 1, len(universe) - 1)]
+        edges.append((
+            float(b - step if a == b else a),
+            float(b),
+            float(b + step if c == b else c),
+        ))
+    return tuple(edges)
+
+
+_X = _edges(X_TRI, np.arange(-400, 401))
+_Y = _edges(Y_TRI, np.arange(-200, 201))
+_V = _edges(V_TRI, np.arange(-10, 11))
+_V_UNIVERSE = np.arange(-10.0, 11.0)
+
+
+@njit(cache=True, fastmath=True)
+def _membership(u, tri):
+    a, b, c = tri
+    return min(max(min((u - a) / (b - a), (c - u) / (c - b)), 0.0), 1.0)
+
+
+@njit(cache=True, fastmath=True)
+def _segment_moments(lo, hi, cuts):
+    """
+    (moment, area) of the max-aggregated clipped velocity terms on [lo, hi],
+    integrated the way skfuzzy's centroid does: the clipping points are
+    added to the universe and the aggregate is taken as linear between them.
+    """
+    terms = len(_V)
+    universe = np.empty(len(_V_UNIVERSE) + 2 * terms + 2)
+    universe[0] = lo
+    universe[1] = hi
+    n = 2
+    for u in _V_UNIVERSE:
+        if lo < u < hi:
+            universe[n] = u
+            n += 1
+    for k in range(terms):
+        a, b, c = _V[k]
+        for u in (a + cuts[k] * (b - a), c - cuts[k] * (c - b)):
+            if lo < u < hi:
+                universe[n] = u
+                n += 1
+    universe = np.sort(universe[:n])
+
+    mf = np.zeros(n)
+    for k in range(terms):
+        a, b, c = _V[k]
+        if cuts[k] <= 0.0 or c <= lo or a >= hi:
+            continue
+        for i in range(n):
+            mf[i] = max(mf[i], min(cuts[k], _membership(universe[i], _V[k])))
+
+    moment = 0.0
+    area = 0.0
+    for i in range(1, n):
+        width = universe[i] - universe[i - 1]
+        height = mf[i - 1] + mf[i]
+        if width > 0.0 and height > 0.0:
+            segment = 0.5 * width * height
+            moment += segment * (
+                universe[i - 1] + width * (mf[i - 1] + 2.0 * mf[i]) / (3.0 * height)
+            )
+            area += segment
+    return moment, area
+
+
+def _shared_segments():
+    """
+    [lo, hi] intervals where two neighbouring velocity terms are both non-zero.
+    """
+    lo, hi = _V_UNIVERSE[0], _V_UNIVERSE[-1]
+    shared = []
+    for k in range(len(_V) - 1):
+        start, stop = max(_V[k + 1][0], lo), min(_V[k][2], hi)
+        if start < stop:
+            shared.append((float(start), float(stop)))
+    return tuple(shared)
+
+
+@functools.lru_cache(maxsize=None)
+def _moment_tables(levels=101):
+    """
+    Centroid moment and area of every velocity term clipped at
+    alpha = 0, 1/(levels-1), ..., 1, leaving out the shared segments
+    (they are not separable under max aggregation). Shape (terms, levels).
+    Built on the first FuzzyPlayer, so importing the module compiles nothing.
+    """
+    terms = len(_V)
+    num = np.zeros((terms, levels))
+    den = np.zeros((terms, levels))
+    for k in range(terms):
+        for q, alpha in enumerate(np.linspace(0.0, 1.0, levels)):
+            cuts = np.zeros(terms)
+            cuts[k] = alpha
+            num[k, q], den[k, q] = _segment_moments(
+                _V_UNIVERSE[0], _V_UNIVERSE[-1], cuts
+            )
+            for lo, hi in _SHARED:
+                moment, area = _segment_moments(lo, hi, cuts)
+                num[k, q] -= moment
+                den[k, q] -= area
+    return num, den
+
+
+_SHARED = _shared_segments()
+
+
+@njit(cache=True, fastmath=True)
+def _fuzzy_velocity(x, y, num_lut, den_lut):
+    """
+    Mamdani inference of FuzzyPlayer's rule base for one (x_dist, y_dist).
+
+    Mirrors skfuzzy's ControlSystemSimulation: rule strengths are
+    accumulated per velocity term with max and the clipped terms are
+    defuzzified with the centroid. Each term's contribution is read from
+    the moment tables num_lut, den_lut of _moment_tables (interpolated in
+    alpha), only the shared segments between neighbouring terms are
+    integrated per call. The rule base and terms are module constants,
+    which Numba freezes into the code.
+    """
+    cuts = np.zeros(len(_V))
+    for r in range(len(RULES)):
+        xi, y_mask, vi = RULES[r]
+        strength = _membership(x, _X[xi])
+        if y_mask:
+            y_strength = 0.0
+            for j in range(len(_Y)):
+                if y_mask & (1 << j):
+                    y_strength = max(y_strength, _membership(y, _Y[j]))
+            strength = min(strength, y_strength)
+        cuts[vi] = max(cuts[vi], strength)
+
+    steps = num_lut.shape[1] - 1
+    moment = 0.0
+    area = 0.0
+    for k in range(len(_V)):
+        level = cuts[k] * steps
+        q = min(int(level), steps - 1)
+        t = level - q
+        moment += num_lut[k, q] + t * (num_lut[k, q + 1] - num_lut[k, q])
+        area += den_lut[k, q] + t * (den_lut[k, q + 1] - den_lut[k, q])
+    for lo, hi in _SHARED:
+        m, s = _segment_moments(lo, hi, cuts)
+        moment += m
+        area += s
+    return moment / max(area, np.finfo(np.float64).eps)
 
 
 class FuzzyPlayer(Player):
     def __init__(self, racket: Racket, ball: Ball, board: Board):
         super(FuzzyPlayer, self).__init__(racket, ball, board)
         # for Mamdami:
-        self.x_diff = fuzz.control.Antecedent(range(-400, 401), 'x_dist')
-        self.y_diff = fuzz.control.Antecedent(range(-200, 201), 'y_dist')
-        self.velocity = fuzz.control.Consequent(range(-10, 11), 'velocity')
+        self.x_diff = fuzz.control.Antecedent(np.arange(-400, 401, dtype=np.float32), 'x_dist')
+        self.y_diff = fuzz.control.Antecedent(np.arange(-200, 201, dtype=np.float32), 'y_dist')
+        self.velocity = fuzz.control.Consequent(np.arange(-10, 11, dtype=np.float32), 'velocity')
 
         #self.racket_controller = fuzz.control.ControlSystem...
 
 
         #prędkość
-        self.velocity['fast_left'] = fuzz.trimf(self.velocity.universe, [-10, -10, -10])
-        self.velocity['slow_left'] = fuzz.trimf(self.velocity.universe, [-9, -9, -3])
-        self.velocity['stop'] = fuzz.trimf(self.velocity.universe, [-3, 0, 3])
-        self.velocity['slow_right'] = fuzz.trimf(self.velocity.universe, [3, 9, 9])
-        self.velocity['fast_right'] = fuzz.trimf(self.velocity.universe, [10, 10, 10])
+        for label, tri in zip(V_TERMS, V_TRI):
+            self.velocity[label] = fuzz.trimf(self.velocity.universe, tri)
 
         #dla x (800)
-        #punkty
-        #-edge    -middle_edge     -middle_edge/2      center(0)        middle_edge/2       middle_edge      edge
-        edge = 400
-        middle_edge = 30
-        self.x_diff['far_left'] = fuzz.trimf(self.x_diff.universe, [-edge, -edge, -middle_edge+10])
-        self.x_diff['left'] = fuzz.trimf(self.x_diff.universe, [-middle_edge, -middle_edge/2, 0])
-        self.x_diff['center'] = fuzz.trimf(self.x_diff.universe, [-middle_edge/2, 0, middle_edge/2])
-        self.x_diff['right'] = fuzz.trimf(self.x_diff.universe, [0, middle_edge/2, middle_edge])
-        self.x_diff['far_right'] = fuzz.trimf(self.x_diff.universe, [middle_edge-10, edge, edge])
+        for label, tri in zip(X_TERMS, X_TRI):
+            self.x_diff[label] = fuzz.trimf(self.x_diff.universe, tri)
 
         #dla y (400)
-        self.y_diff['above'] = fuzz.trimf(self.y_diff.universe, [-200, -100, 0])
-        self.y_diff['center'] = fuzz.trimf(self.y_diff.universe, [-100, 0, 100])
-        self.y_diff['below'] = fuzz.trimf(self.y_diff.universe, [0, 100, 200])
-
-
-        rules = [
-            fuzzcontrol.Rule(self.x_diff['left'] & (self.y_diff['above'] | self.y_diff['center']), self.velocity['fast_right']),
-            fuzzcontrol.Rule(self.x_diff['right'] & (self.y_diff['above'] | self.y_diff['center']), self.velocity['fast_left']),
-
-            fuzzcontrol.Rule(self.x_diff['far_left'], self.velocity['fast_right']),
-            fuzzcontrol.Rule(self.x_diff['left'], self.velocity['slow_right']),
-            fuzzcontrol.Rule(self.x_diff['center'], self.velocity['stop']),
-            fuzzcontrol.Rule(self.x_diff['right'], self.velocity['slow_left']),
-            fuzzcontrol.Rule(self.x_diff['far_right'], self.velocity['fast_left']),
-        ]
-
+        for label, tri in zip(Y_TERMS, Y_TRI):
+            self.y_diff[label] = fuzz.trimf(self.y_diff.universe, tri)
+
+        #np. (1, 0b011, 4): left & (above | center) -> fast_right
+        rules = []
+        for xi, y_mask, vi in RULES:
+            antecedent = self.x_diff[X_TERMS[xi]]
+            y_terms = [
+                self.y_diff[label]
+                for j, label in enumerate(Y_TERMS)
+                if y_mask & (1 << j)
+            ]
+            if y_terms:
+                antecedent = antecedent & functools.reduce(operator.or_, y_terms)
+            rules.append(fuzzcontrol.Rule(antecedent, self.velocity[V_TERMS[vi]]))
 
         self.racket_controller = fuzzcontrol.ControlSystem(rules)
         self.racket_simulation = fuzzcontrol.ControlSystemSimulation(self.racket_controller)
 
-    def act(self, x_diff: int, y_diff: int):
-        velocity = self.make_decision(x_diff, y_diff)
-        self.move(self.racket.rect.x + velocity)
+        #y_dist tylko wzmacnia reguły left/right, gdy piłka jest na wysokości
+        #paletki; tablica bierze tę chwilę (y_dist = 0, above|center = 1)
+        #wypełnia ją jądro numba, a nie wektorowe compute() skfuzzy (~0.1 s,
+        #ta sama tablica), żeby simulate zostało niezależną referencją
+        num_lut, den_lut = _moment_tables()
+        self._lut_1d = np.array(
+            [
+                round(_fuzzy_velocity(float(x), 0.0, num_lut, den_lut))
+                for x in range(-400, 401)
+            ],
+            dtype=np.int8,
+        )
+        self._velocity = 0
 
-    def make_decision(self, x_diff: int, y_diff: int):
-        # for Mamdami:
+    def simulate(self, x_diff, y_diff):
+        """
+        Reference (slow) evaluation through skfuzzy, accepts arrays.
+        """
+        self.racket_simulation.reset()
         self.racket_simulation.input['x_dist'] = x_diff
         self.racket_simulation.input['y_dist'] = y_diff
-        self.racket_simulation.compute()
-        
         try:
+            self.racket_simulation.compute()
             velocity = self.racket_simulation.output['velocity']
-            return velocity
         except:
-            return 0
+            return np.zeros(np.shape(x_diff))
+        return np.nan_to_num(velocity)
+
+    def act(self, x_diff: int, y_diff: int):
+        velocity = self.make_decision(x_diff, y_diff)
+        self._velocity = velocity
+        self.move(self.racket.rect.x + velocity)
+
+    def hold(self):
+        self.move(self.racket.rect.x + self._velocity)
+
+    def make_decision(self, x_diff: int, y_diff: int):
+        xi = max(-400, min(400, x_diff))
+        return int(self._lut_1d[xi + 400])
 
 
 if __name__ == "__main__":